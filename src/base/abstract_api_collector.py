@@ -1,8 +1,40 @@
+import aiohttp
+import hashlib
+import json
+import logging
+import orjson
+import os
 import requests
+import requests_cache
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from src.utils.logging import configure_logger, log_and_trace
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from requests_cache import BaseCache
+from tenacity import RetryCallState, Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib3.util.retry import Retry
+from src.utils.logging import configure_logger
+
+# Connection pool sizing for the shared HTTPAdapter
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 100
+
+# Connection pools and cache backends shared by collectors with the same host, credentials and cache settings;
+# each collector still gets its own session so headers, auth and cookies stay per instance
+_SHARED_POOLS: Dict[Tuple[Any, ...], Tuple[HTTPAdapter, BaseCache]] = {}
+_SHARED_POOLS_LOCK = threading.Lock()
+
+# Content types handed to _postprocess as raw bytes instead of being JSON-decoded
+BINARY_CONTENT_TYPES = ("application/octet-stream", "application/x-protobuf", "application/vnd.apache.arrow")
+
+# Attempts for re-fetching a response whose body fails to decode (e.g. truncated mid-transfer);
+# only idempotent methods are re-sent
+DECODE_RETRY_ATTEMPTS = 3
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
 
 # Abstract Base Class
 class AbstractAPICollector(ABC):
@@ -12,8 +44,19 @@ class AbstractAPICollector(ABC):
     - Configuration setup for authentication.
     - Common request handling for GET/POST methods.
     - Error handling for robustness.
+    - Async request handling via aiohttp for concurrent fan-out (use ``async with collector:``).
+    - On-disk caching of GET responses, revalidated with Cache-Control/ETag.
     """
 
+    # Created once per subclass in __init_subclass__
+    logger: logging.Logger
+
+    # GET response cache settings; set cache_expire_after to requests_cache.DO_NOT_CACHE to disable.
+    # cache_dir defaults to the platform user cache directory.
+    cache_backend: str = "sqlite"
+    cache_expire_after: int = 3600
+    cache_dir: Optional[str] = None
+
     def __init__(self, base_url: str, api_key: Optional[str] = None, username: Optional[str] = None, password: Optional[str] = None):
         """
         Initialize the API collector.
@@ -23,29 +66,244 @@ class AbstractAPICollector(ABC):
             api_key (Optional[str]): API key for authentication (default is None).
             username (Optional[str]): Username for basic auth (default is None).
             password (Optional[str]): Password for basic auth (default is None).
+
+        Raises:
+            ValueError: If ``base_url`` has no scheme or host (e.g. ``api.example.com``).
         """
-        self.base_url = base_url
+        parsed = urlparse(base_url)
+        if not parsed.scheme or not parsed.hostname:
+            raise ValueError(f"base_url must be an absolute URL such as 'https://api.example.com', got {base_url!r}")
+        self.base_url = base_url.rstrip("/")
+        self._url_prefix = self.base_url + "/"
         self.api_key = api_key
         self.username = username
         self.password = password
         self.session = self._configure_session()
-        self.logger = configure_logger(self.__class__.__name__)
+        self.async_session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        requests session used by ``_make_request``. Assigning a new session also rebinds ``_request``.
+        """
+        return self._session
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        self._session = session
+        # Bound once so hot paths skip the attribute lookup; subclasses can bind known endpoints with
+        # functools.partial(self._request, "GET", self._url_prefix + "foo").
+        # Patching session.request afterwards (e.g. mock.patch.object) does not reach _request;
+        # patch collector._request instead, or reassign collector.session.
+        self._request = session.request
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Attaches a logger to each subclass so instances share it instead of configuring one per instance.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.logger = configure_logger(cls.__name__)
+
+    def _configure_session(self) -> requests_cache.CachedSession:
+        """
+        Builds this collector's session on top of the connection pool and cache backend shared by all
+        collectors with the same ``_session_key()``, so warmed connections are reused across instances
+        while headers, auth and cookies set on one session never leak into another.
+
+        Returns:
+            requests_cache.CachedSession: Configured per-instance session.
+        """
+        key = self._session_key()
+        with _SHARED_POOLS_LOCK:
+            shared = _SHARED_POOLS.get(key)
+            if shared is None:
+                shared = _SHARED_POOLS[key] = (self._build_adapter(), self._build_cache_backend())
+        adapter, cache = shared
+        return self._build_session(adapter, cache)
+
+    def _session_key(self) -> Tuple[Any, ...]:
+        """
+        Identifies which collectors may share a pool: same host, same credentials and same cache settings.
+
+        Returns:
+            Tuple[Any, ...]: Hashable registry key; credentials appear only as a fingerprint.
+        """
+        parsed = urlparse(self.base_url)
+        return (parsed.scheme, parsed.netloc, self._credential_fingerprint(), self.cache_backend, self.cache_expire_after, self.cache_dir)
+
+    @staticmethod
+    def close_all() -> None:
+        """
+        Closes and forgets every shared connection pool and cache backend, for all collector classes,
+        e.g. on application shutdown.
+        """
+        with _SHARED_POOLS_LOCK:
+            shared = list(_SHARED_POOLS.values())
+            _SHARED_POOLS.clear()
+        for adapter, cache in shared:
+            adapter.close()
+            cache.close()
+
+    def _credential_fingerprint(self) -> str:
+        """
+        Hashes the configured credentials so they can key caches without being stored in clear.
+
+        Returns:
+            str: Short hex digest identifying the credential set.
+        """
+        credentials = "\0".join(value or "" for value in (self.api_key, self.username, self.password))
+        return hashlib.sha256(credentials.encode()).hexdigest()[:16]
+
+    def _build_adapter(self) -> HTTPAdapter:
+        """
+        Builds the pooled keep-alive adapter shared by collectors with the same session key.
+
+        Returns:
+            HTTPAdapter: Adapter with socket-level retries.
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            # Same policy as the decode retry: never re-send a POST the server may already have processed
+            allowed_methods=IDEMPOTENT_METHODS,
+            # Hand the final 429/5xx back so raise_for_status() raises HTTPError rather than RetryError
+            raise_on_status=False,
+        )
+        return HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+
+    def _build_cache_backend(self) -> BaseCache:
+        """
+        Builds the GET response cache backend shared by collectors with the same session key.
+
+        Returns:
+            BaseCache: Cache backend configured from ``cache_backend`` and ``cache_dir``.
+        """
+        # requests-cache leaves Authorization out of its cache keys, so each session key (which includes the
+        # credential fingerprint) gets its own cache
+        session_digest = hashlib.sha256(repr(self._session_key()).encode()).hexdigest()[:16]
+        # Dots are replaced so the backend still appends its own file extension
+        cache_name = f"{urlparse(self.base_url).hostname}-{session_digest}".replace(".", "_")
+        return requests_cache.init_backend(
+            os.path.join(self.cache_dir, cache_name) if self.cache_dir else cache_name,
+            self.cache_backend,
+            use_cache_dir=self.cache_dir is None,
+        )
 
-    def _configure_session(self) -> requests.Session:
+    def _build_session(self, adapter: HTTPAdapter, cache: BaseCache) -> requests_cache.CachedSession:
         """
-        Configures the requests session for API interaction.
+        Builds a new requests session for API interaction.
+
+        Args:
+            adapter (HTTPAdapter): Shared pooled adapter to mount for http/https.
+            cache (BaseCache): Shared cache backend.
 
         Returns:
-            requests.Session: Configured session with appropriate headers or authentication.
+            requests_cache.CachedSession: Configured session with appropriate headers or authentication,
+            backed by a pooled keep-alive adapter with socket-level retries and a GET response cache.
         """
-        session = requests.Session()
+        session = requests_cache.CachedSession(
+            backend=cache,
+            expire_after=self.cache_expire_after,
+            allowable_methods=("GET",),
+            cache_control=True,
+            stale_if_error=True,
+            # The backend is shared; close_all() owns closing it
+            autoclose=False,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
         if self.api_key:
             session.headers.update({"Authorization": f"Bearer {self.api_key}"})
         if self.username and self.password:
             session.auth = (self.username, self.password)
         return session
 
-    def _make_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def __aenter__(self) -> "AbstractAPICollector":
+        """
+        Lazily opens the aiohttp session used by the async request methods.
+
+        Returns:
+            AbstractAPICollector: The collector itself.
+        """
+        if self.async_session is None or self.async_session.closed:
+            self.async_session = self._configure_async_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """
+        Closes the aiohttp session opened by ``__aenter__``.
+        """
+        if self.async_session is not None:
+            await self.async_session.close()
+            self.async_session = None
+
+    def _configure_async_session(self) -> aiohttp.ClientSession:
+        """
+        Configures the aiohttp session for async API interaction.
+
+        Returns:
+            aiohttp.ClientSession: Configured session with appropriate headers or authentication.
+        """
+        headers = {}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        auth = aiohttp.BasicAuth(self.username, self.password) if self.username and self.password else None
+        return aiohttp.ClientSession(headers=headers, auth=auth)
+
+    def _postprocess(self, payload: Any) -> Any:
+        """
+        Hook applied to every decoded response before it is returned; the default returns it unchanged.
+        JSON bodies arrive as native Python objects, binary bodies (see ``BINARY_CONTENT_TYPES``) as bytes,
+        so numeric subclasses can take a zero-copy NumPy view and hand it to a compiled kernel, e.g.::
+
+            @numba.njit(parallel=True)
+            def _sum_positive(values):
+                total = 0.0
+                for i in numba.prange(values.shape[0]):
+                    if values[i] > 0:
+                        total += values[i]
+                return total
+
+            class MetricsCollector(AbstractAPICollector):
+                def _postprocess(self, payload):
+                    if isinstance(payload, bytes):
+                        return _sum_positive(numpy.frombuffer(payload, dtype=numpy.float64))
+                    return payload
+
+        Args:
+            payload (Any): Decoded JSON or raw bytes of the response.
+
+        Returns:
+            Any: Processed payload.
+        """
+        return payload
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        """
+        Logs how long the wrapped block took, skipping the clock reads entirely when INFO is disabled.
+
+        Args:
+            name (str): Name of the operation being timed.
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            yield
+            return
+        start_ns = time.perf_counter_ns()
+        yield
+        self.logger.info("%s completed in %.2fms", name, (time.perf_counter_ns() - start_ns) / 1e6)
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        parser: Optional[Callable[[bytes], Any]] = orjson.loads,
+    ) -> Any:
         """
         Internal method to make HTTP requests.
 
@@ -54,28 +312,172 @@ class AbstractAPICollector(ABC):
             endpoint (str): API endpoint to call.
             params (Optional[Dict[str, Any]]): Query parameters (default is None).
             data (Optional[Dict[str, Any]]): Request body for POST/PUT requests (default is None).
+            stream (bool): Defer downloading the body until it is read (default is False). Streamed requests
+                bypass the response cache, which would otherwise read and store the whole body.
+            parser (Optional[Callable[[bytes], Any]]): Decoder applied to the raw body (default is orjson.loads).
+                Binary content types bypass only the default decoder; an explicit parser always runs.
+                Pass None to skip decoding and get the ``requests.Response`` back, e.g. with ``stream=True``
+                to consume ``iter_content()`` incrementally.
 
         Returns:
-            Dict[str, Any]: Parsed JSON response.
+            Any: Response passed through ``_postprocess`` (parsed JSON, raw bytes for binary content types,
+            or None for an empty body), or the response object itself when ``parser`` is None.
 
         Raises:
             requests.RequestException: If the request fails or the response is invalid.
+            json.JSONDecodeError: If the body still fails to decode after retrying.
         """
-        url = f"{self.base_url}/{endpoint}"
-        start_time = time.time()
+        url = self._url_prefix + endpoint
+        attempts = DECODE_RETRY_ATTEMPTS if method.upper() in IDEMPOTENT_METHODS else 1
+
+        def _log_retry(retry_state: RetryCallState) -> None:
+            self.logger.warning(
+                "Retrying %s %s after undecodable response (attempt %d of %d): %s",
+                method,
+                url,
+                retry_state.attempt_number,
+                attempts,
+                retry_state.outcome.exception(),
+            )
+
         try:
-            response = self.session.request(method, url, params=params, json=data)
-            response.raise_for_status()
-            log_and_trace(self.logger, "_make_request", start_time, response)
-            return response.json()
+            with self._timed("_make_request"):
+                # 429/5xx are retried by the adapter's urllib3 Retry on the same pooled connection;
+                # this loop only covers bodies that arrive but fail to decode.
+                for attempt in Retrying(
+                    stop=stop_after_attempt(attempts),
+                    wait=wait_exponential(multiplier=0.2),
+                    retry=retry_if_exception_type(json.JSONDecodeError),
+                    before_sleep=_log_retry,
+                    reraise=True,
+                ):
+                    with attempt:
+                        if stream:
+                            response = self._send_uncached(method, url, params=params, data=data)
+                        else:
+                            response = self._request(method, url, params=params, json=data)
+                        response.raise_for_status()
+                        if parser is None:
+                            return response
+                        if not response.content:
+                            payload = None
+                        elif parser is orjson.loads and response.headers.get("Content-Type", "").startswith(BINARY_CONTENT_TYPES):
+                            payload = response.content
+                        else:
+                            try:
+                                payload = parser(response.content)
+                            except json.JSONDecodeError:
+                                self._evict_cached(response)
+                                raise
+            return self._postprocess(payload)
         except requests.HTTPError as http_err:
-            self.logger.error(f"HTTP error occurred: {http_err}")
+            self.logger.error("HTTP error occurred: %s", http_err)
             raise
         except requests.RequestException as req_err:
-            self.logger.error(f"Request error occurred: {req_err}")
+            self.logger.error("Request error occurred: %s", req_err)
+            raise
+        except Exception as err:
+            self.logger.error("Unexpected error: %s", err)
+            raise
+
+    def _send_uncached(self, method: str, url: str, params: Optional[Dict[str, Any]] = None, data: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Sends a streamed request past the response cache, which would otherwise read and store the whole body.
+        The session's headers, auth and pooled adapter still apply. Unlike ``session.cache_disabled()``
+        this does not toggle session state, so it is safe under ``fetch_many``'s threads.
+
+        Args:
+            method (str): HTTP method ('GET', 'POST', etc.).
+            url (str): Full request URL.
+            params (Optional[Dict[str, Any]]): Query parameters (default is None).
+            data (Optional[Dict[str, Any]]): Request body for POST/PUT requests (default is None).
+
+        Returns:
+            requests.Response: Response whose body has not been read yet.
+        """
+        prepared = self.session.prepare_request(requests.Request(method, url, params=params, json=data))
+        settings = self.session.merge_environment_settings(prepared.url, {}, True, None, None)
+        return requests.Session.send(self.session, prepared, **settings)
+
+    def _evict_cached(self, response: requests.Response) -> None:
+        """
+        Drops a response from the GET cache so a retry goes back to the server instead of replaying it.
+
+        Args:
+            response (requests.Response): Response whose request should be forgotten.
+        """
+        cache = getattr(self.session, "cache", None)
+        if cache is not None:
+            cache.delete(requests=[response.request])
+
+    def fetch_many(self, endpoints: List[str], params_list: Optional[List[Optional[Dict[str, Any]]]] = None, max_workers: int = 32) -> List[Any]:
+        """
+        Fetches several endpoints concurrently with GET requests over the pooled session.
+
+        Args:
+            endpoints (List[str]): API endpoints to call.
+            params_list (Optional[List[Optional[Dict[str, Any]]]]): Query parameters per endpoint (default is None).
+            max_workers (int): Number of worker threads, capped at the adapter pool size (default is 32).
+
+        Returns:
+            List[Any]: Parsed responses, in the same order as ``endpoints``.
+
+        Raises:
+            requests.RequestException: If any of the requests fails.
+        """
+        if params_list is None:
+            params_list = [None] * len(endpoints)
+        if len(params_list) != len(endpoints):
+            raise ValueError("params_list must have the same length as endpoints")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, POOL_MAXSIZE))) as executor:
+            futures = [executor.submit(self._make_request, "GET", endpoint, params) for endpoint, params in zip(endpoints, params_list)]
+            return [future.result() for future in futures]
+
+    async def _make_request_async(
+        self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, data: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Internal coroutine to make HTTP requests without blocking the event loop.
+        Must be awaited inside ``async with collector:`` so the aiohttp session is open;
+        many calls can then be overlapped with ``asyncio.gather``.
+
+        Args:
+            method (str): HTTP method ('GET', 'POST', etc.).
+            endpoint (str): API endpoint to call.
+            params (Optional[Dict[str, Any]]): Query parameters (default is None).
+            data (Optional[Dict[str, Any]]): Request body for POST/PUT requests (default is None).
+
+        Returns:
+            Any: Response passed through ``_postprocess`` (None for an empty body).
+
+        Raises:
+            aiohttp.ClientError: If the request fails or the response is invalid.
+        """
+        if self.async_session is None:
+            raise RuntimeError(f"{self.__class__.__name__} async session is not open; use 'async with' first")
+        url = self._url_prefix + endpoint
+        try:
+            with self._timed("_make_request_async"):
+                async with self.async_session.request(
+                    method, url, params=params, json=data, timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+                    # aiohttp reports application/octet-stream when the header is missing; treat that as JSON like the sync path
+                    is_binary = "Content-Type" in response.headers and response.content_type.startswith(BINARY_CONTENT_TYPES)
+                    if not body:
+                        payload = None
+                    else:
+                        payload = body if is_binary else orjson.loads(body)
+            return self._postprocess(payload)
+        except aiohttp.ClientResponseError as http_err:
+            self.logger.error("HTTP error occurred: %s", http_err)
+            raise
+        except aiohttp.ClientError as req_err:
+            self.logger.error("Request error occurred: %s", req_err)
             raise
         except Exception as err:
-            self.logger.error(f"Unexpected error: {err}")
+            self.logger.error("Unexpected error: %s", err)
             raise
 
     @abstractmethod
@@ -88,3 +490,14 @@ class AbstractAPICollector(ABC):
             params (Optional[Dict[str, Any]]): Query parameters for the request (default is None).
         """
         pass
+
+    async def fetch_data_async(self, endpoint: str, params: Optional[Dict[str, Any]] = None):
+        """
+        Async counterpart of ``fetch_data``. Override to fan out with ``asyncio.gather``;
+        the default issues a single GET through ``_make_request_async``.
+
+        Args:
+            endpoint (str): API endpoint.
+            params (Optional[Dict[str, Any]]): Query parameters for the request (default is None).
+        """
+        return await self._make_request_async("GET", endpoint, params=params)
@@ -7,6 +7,7 @@ from typing import Any, Dict, Optional
 def configure_logger(name: str) -> logging.Logger:
     """
     Configures a logger for logging events and errors.
+    Safe to call repeatedly: a logger that already has handlers is returned unchanged.
 
     Args:
         name (str): Name of the logger.
@@ -15,6 +16,9 @@ def configure_logger(name: str) -> logging.Logger:
         logging.Logger: Configured logger instance.
     """
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+    logger.propagate = False
     logger.setLevel(logging.INFO)
     handler = logging.StreamHandler()
     formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -30,12 +34,14 @@ def log_and_trace(logger: logging.Logger, method_name: str, start_time: float, r
     Args:
         logger (logging.Logger): Logger instance for logging.
         method_name (str): Name of the method being traced.
-        start_time (float): Start time of the request.
+        start_time (float): Start time of the request, as returned by ``time.time()``.
         response (Optional[requests.Response]): Response object (default is None).
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     elapsed_time = time.time() - start_time
     if response:
-        logger.info(f"{method_name} completed in {elapsed_time:.2f}s with status code {response.status_code}")
+        logger.info("%s completed in %.2fs with status code %d", method_name, elapsed_time, response.status_code)
     else:
-        logger.info(f"{method_name} completed in {elapsed_time:.2f}s")
+        logger.info("%s completed in %.2fs", method_name, elapsed_time)
 
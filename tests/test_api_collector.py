@@ -0,0 +1,339 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import urlparse
+
+import pytest
+import requests
+import requests_cache
+
+from src.base.abstract_api_collector import AbstractAPICollector
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Serves canned responses from ``server.routes`` and counts hits per (method, path).
+    A route is either a ``(status, headers, body)`` tuple or a callable taking the handler and returning one.
+    """
+
+    def _respond(self):
+        path = urlparse(self.path).path
+        self.server.hits[(self.command, path)] += 1
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        route = self.server.routes.get(path, (404, {}, b""))
+        status, headers, body = route(self) if callable(route) else route
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.routes = {}
+    httpd.hits = Counter()
+    httpd.base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def collector_cls(tmp_path):
+    class Collector(AbstractAPICollector):
+        cache_dir = str(tmp_path)
+
+        def fetch_data(self, endpoint, params=None):
+            return self._make_request("GET", endpoint, params=params)
+
+    return Collector
+
+
+@pytest.fixture(autouse=True)
+def _close_sessions():
+    yield
+    AbstractAPICollector.close_all()
+
+
+JSON = {"Content-Type": "application/json"}
+
+
+def test_cache_is_not_shared_between_credentials(server, collector_cls):
+    server.routes["/me"] = lambda handler: (200, JSON, b'{"user": "%s"}' % handler.headers["Authorization"].encode())
+
+    alice = collector_cls(server.base_url, api_key="alice")
+    bob = collector_cls(server.base_url, api_key="bob")
+
+    assert alice.fetch_data("me") == {"user": "Bearer alice"}
+    assert bob.fetch_data("me") == {"user": "Bearer bob"}
+    assert alice.fetch_data("me") == {"user": "Bearer alice"}
+    assert server.hits[("GET", "/me")] == 2
+
+
+def test_cache_is_written_under_cache_dir(server, collector_cls, tmp_path):
+    server.routes["/items"] = (200, JSON, b"[1, 2]")
+    collector = collector_cls(server.base_url, api_key="alice")
+
+    assert collector.fetch_data("items") == [1, 2]
+    assert collector.fetch_data("items") == [1, 2]
+    assert server.hits[("GET", "/items")] == 1
+    assert list(tmp_path.glob("*.sqlite"))
+
+
+def test_exhausted_status_retries_raise_http_error(server, collector_cls):
+    server.routes["/down"] = (503, JSON, b"{}")
+    collector = collector_cls(server.base_url)
+
+    with pytest.raises(requests.HTTPError) as exc_info:
+        collector.fetch_data("down")
+    assert exc_info.value.response.status_code == 503
+    assert server.hits[("GET", "/down")] == 4
+
+
+def test_post_is_not_retried_on_server_error(server, collector_cls):
+    server.routes["/down"] = (503, JSON, b"{}")
+    collector = collector_cls(server.base_url)
+
+    with pytest.raises(requests.HTTPError):
+        collector._make_request("POST", "down", data={"a": 1})
+    assert server.hits[("POST", "/down")] == 1
+
+
+def test_registry_shares_session_for_same_host_and_settings(server, collector_cls):
+    class Other(collector_cls):
+        pass
+
+    first = collector_cls(server.base_url, api_key="alice")
+    second = Other(server.base_url, api_key="alice")
+    other_key = collector_cls(server.base_url, api_key="bob")
+
+    assert first.session is not second.session
+    assert first.session.get_adapter(server.base_url) is second.session.get_adapter(server.base_url)
+    assert first.session.cache is second.session.cache
+    assert first.session.get_adapter(server.base_url) is not other_key.session.get_adapter(server.base_url)
+    assert first.session.cache is not other_key.session.cache
+
+
+def test_session_customisation_stays_per_instance(server, collector_cls):
+    server.routes["/tenant"] = lambda handler: (200, JSON, b'"%s"' % handler.headers["X-Tenant"].encode())
+
+    class Tenant(collector_cls):
+        cache_expire_after = requests_cache.DO_NOT_CACHE
+
+        def __init__(self, base_url, tenant):
+            super().__init__(base_url)
+            self.session.headers["X-Tenant"] = tenant
+
+    first = Tenant(server.base_url, "one")
+    second = Tenant(server.base_url, "two")
+
+    assert first.fetch_data("tenant") == "one"
+    assert second.fetch_data("tenant") == "two"
+
+
+def test_registry_honours_per_class_cache_settings(server, collector_cls):
+    counter = iter(range(1, 100))
+    server.routes["/n"] = lambda handler: (200, JSON, b'{"n": %d}' % next(counter))
+
+    class Live(collector_cls):
+        cache_expire_after = requests_cache.DO_NOT_CACHE
+
+    cached = collector_cls(server.base_url)
+    live = Live(server.base_url)
+
+    assert cached.fetch_data("n") == {"n": 1}
+    assert live.session is not cached.session
+    assert live.fetch_data("n") == {"n": 2}
+    assert live.fetch_data("n") == {"n": 3}
+    assert cached.fetch_data("n") == {"n": 1}
+
+
+def test_close_all_closes_and_forgets_shared_pools(server, collector_cls, monkeypatch):
+    collector = collector_cls(server.base_url)
+    adapter = collector.session.get_adapter(server.base_url)
+    closed = []
+    monkeypatch.setattr(adapter, "close", lambda: closed.append("adapter"))
+    monkeypatch.setattr(collector.session.cache, "close", lambda: closed.append("cache"))
+
+    AbstractAPICollector.close_all()
+
+    assert closed == ["adapter", "cache"]
+    assert collector_cls(server.base_url).session.get_adapter(server.base_url) is not adapter
+
+
+def test_decode_retry_refetches_instead_of_replaying_cache(server, collector_cls):
+    bodies = iter([b'{"x": ', b'{"x": ', b'{"x": 1}'])
+    server.routes["/flaky"] = lambda handler: (200, JSON, next(bodies))
+    collector = collector_cls(server.base_url)
+
+    assert collector.fetch_data("flaky") == {"x": 1}
+    assert server.hits[("GET", "/flaky")] == 3
+    assert collector.fetch_data("flaky") == {"x": 1}
+    assert server.hits[("GET", "/flaky")] == 3
+
+
+def test_decode_failure_is_not_retried_for_post(server, collector_cls):
+    server.routes["/bad"] = (200, JSON, b'{"x": ')
+    collector = collector_cls(server.base_url)
+
+    with pytest.raises(json.JSONDecodeError):
+        collector._make_request("POST", "bad", data={"a": 1})
+    assert server.hits[("POST", "/bad")] == 1
+
+
+def test_empty_body_returns_none_without_retry(server, collector_cls):
+    server.routes["/nocontent"] = (204, {}, b"")
+    collector = collector_cls(server.base_url)
+
+    async def post_async():
+        async with collector:
+            return await collector._make_request_async("POST", "nocontent")
+
+    assert collector._make_request("POST", "nocontent") is None
+    assert collector.fetch_data("nocontent") is None
+    assert asyncio.run(post_async()) is None
+    assert server.hits[("POST", "/nocontent")] == 2
+    assert server.hits[("GET", "/nocontent")] == 1
+
+
+def test_postprocess_receives_json_or_raw_bytes(server, collector_cls):
+    server.routes["/json"] = (200, JSON, b'{"x": 1}')
+    server.routes["/blob"] = (200, {"Content-Type": "application/octet-stream"}, b"\x00\x01")
+
+    class Recording(collector_cls):
+        def _postprocess(self, payload):
+            return ("processed", payload)
+
+    collector = Recording(server.base_url)
+
+    assert collector.fetch_data("json") == ("processed", {"x": 1})
+    assert collector.fetch_data("blob") == ("processed", b"\x00\x01")
+    assert collector._make_request("GET", "blob", parser=lambda body: body[::-1]) == ("processed", b"\x01\x00")
+
+
+def test_async_path_matches_sync_without_content_type(server, collector_cls):
+    server.routes["/untyped"] = (200, {}, b'{"x": 1}')
+    collector = collector_cls(server.base_url)
+
+    async def fetch():
+        async with collector:
+            return await collector.fetch_data_async("untyped")
+
+    assert asyncio.run(fetch()) == {"x": 1}
+    assert collector.fetch_data("untyped") == {"x": 1}
+
+
+def test_fetch_many_preserves_input_order(server, collector_cls):
+    def slow(handler):
+        time.sleep(0.2)
+        return (200, JSON, b'"slow"')
+
+    server.routes["/slow"] = slow
+    server.routes["/fast"] = (200, JSON, b'"fast"')
+    server.routes["/echo"] = lambda handler: (200, JSON, b'"%s"' % urlparse(handler.path).query.encode())
+    collector = collector_cls(server.base_url)
+
+    assert collector.fetch_many(["slow", "fast", "echo"], [None, None, {"q": "1"}]) == ["slow", "fast", "q=1"]
+
+
+def test_fetch_many_raises_on_failed_endpoint(server, collector_cls):
+    server.routes["/ok"] = (200, JSON, b"{}")
+    collector = collector_cls(server.base_url)
+
+    with pytest.raises(requests.HTTPError):
+        collector.fetch_many(["ok", "missing"])
+    with pytest.raises(ValueError):
+        collector.fetch_many(["ok", "ok"], [None])
+
+
+def test_stream_bypasses_cache_and_defers_body(server, collector_cls):
+    body = b"x" * (1024 * 1024)
+    server.routes["/big"] = (200, {"Content-Type": "application/octet-stream"}, body)
+    collector = collector_cls(server.base_url)
+
+    response = collector._make_request("GET", "big", stream=True, parser=None)
+
+    assert response._content_consumed is False
+    assert b"".join(response.iter_content(chunk_size=65536)) == body
+    assert not collector.session.cache.contains(request=response.request)
+    collector._make_request("GET", "big", stream=True, parser=None).close()
+    assert server.hits[("GET", "/big")] == 2
+
+
+def test_each_subclass_gets_one_shared_logger(server, collector_cls):
+    class Orders(collector_cls):
+        pass
+
+    class Users(collector_cls):
+        pass
+
+    instances = [Orders(server.base_url) for _ in range(5)]
+
+    assert Orders.logger.name == "Orders"
+    assert Users.logger.name == "Users"
+    assert all(instance.logger is Orders.logger for instance in instances)
+    assert all("logger" not in vars(instance) for instance in instances)
+    assert len(Orders.logger.handlers) == 1
+
+
+def test_timed_skips_clock_below_info(server, collector_cls, monkeypatch):
+    server.routes["/quiet"] = (200, JSON, b"{}")
+
+    class Quiet(collector_cls):
+        pass
+
+    Quiet.logger.setLevel(logging.WARNING)
+    clock_calls = []
+    monkeypatch.setattr(time, "perf_counter_ns", lambda: clock_calls.append(True) or 0)
+
+    assert Quiet(server.base_url).fetch_data("quiet") == {}
+    assert clock_calls == []
+
+
+def test_timed_logs_once_at_info(server, collector_cls, monkeypatch):
+    server.routes["/loud"] = (200, JSON, b"{}")
+
+    class Loud(collector_cls):
+        pass
+
+    records = []
+    monkeypatch.setattr(Loud.logger.handlers[0], "emit", records.append)
+
+    assert Loud(server.base_url).fetch_data("loud") == {}
+    assert [record.getMessage().split(" completed in ")[0] for record in records] == ["_make_request"]
+
+
+def test_reassigning_session_rebinds_request(server, collector_cls):
+    collector = collector_cls(server.base_url)
+    replacement = requests.Session()
+    replacement.request = mock.Mock(side_effect=RuntimeError("replacement used"))
+
+    collector.session = replacement
+
+    with pytest.raises(RuntimeError, match="replacement used"):
+        collector.fetch_data("anything")
+    assert server.hits[("GET", "/anything")] == 0
+
+
+@pytest.mark.parametrize("base_url", ["api.example.com", "/v1", "http://"])
+def test_rejects_base_url_without_scheme_or_host(collector_cls, base_url):
+    with pytest.raises(ValueError):
+        collector_cls(base_url)
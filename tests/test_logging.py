@@ -0,0 +1,46 @@
+import logging
+import time
+
+from src.utils.logging import configure_logger, log_and_trace
+
+
+class _ExplodingResponse:
+    """
+    Response stand-in whose status code must never be read.
+    """
+
+    @property
+    def status_code(self):
+        raise AssertionError("status_code read although the record is filtered out")
+
+
+def test_configure_logger_is_idempotent():
+    first = configure_logger("test_configure_logger_is_idempotent")
+    second = configure_logger("test_configure_logger_is_idempotent")
+
+    assert first is second
+    assert len(second.handlers) == 1
+    assert second.propagate is False
+
+
+def test_log_and_trace_skips_work_below_info(monkeypatch):
+    logger = configure_logger("test_log_and_trace_skips_work_below_info")
+    logger.setLevel(logging.WARNING)
+    clock_calls = []
+    monkeypatch.setattr(time, "time", lambda: clock_calls.append(True) or 0.0)
+
+    log_and_trace(logger, "_make_request", 0.0, _ExplodingResponse())
+
+    assert clock_calls == []
+
+
+def test_log_and_trace_emits_at_info(monkeypatch):
+    logger = configure_logger("test_log_and_trace_emits_at_info")
+    records = []
+    monkeypatch.setattr(logger.handlers[0], "emit", records.append)
+    start_time = time.time()
+
+    log_and_trace(logger, "_make_request", start_time)
+
+    assert len(records) == 1
+    assert records[0].getMessage().startswith("_make_request completed in ")